@@ -1,5 +1,6 @@
 from firebolt.async_db.connection import Connection, connect
 from firebolt.async_db.cursor import Cursor
+from firebolt.async_db.util import install_fast_loop
 from firebolt.common._types import (
     ARRAY,
     BINARY,
@@ -7,10 +7,11 @@ from typing import Any, Dict, List, Optional
 
 from httpcore.backends.auto import AutoBackend
 from httpcore.backends.base import AsyncNetworkStream
-from httpx import AsyncHTTPTransport, Timeout
+from httpx import AsyncHTTPTransport, Limits, Timeout
 
 from firebolt.async_db.cursor import Cursor
 from firebolt.async_db.util import (
+    _evict_system_engine_url,
     _get_engine_url_status_db,
     _get_system_engine_url,
 )
@@ -19,8 +20,11 @@ from firebolt.client.auth import Auth
 from firebolt.common.base_connection import BaseConnection
 from firebolt.common.settings import (
     DEFAULT_TIMEOUT_SECONDS,
+    KEEPALIVE_EXPIRY_SECONDS,
     KEEPALIVE_FLAG,
     KEEPIDLE_RATE,
+    MAX_CONNECTIONS,
+    MAX_KEEPALIVE_CONNECTIONS,
 )
 from firebolt.utils.exception import (
     ConfigurationError,
@@ -107,6 +111,7 @@ class Connection(BaseConnection):
         "api_endpoint",
         "_is_closed",
         "_system_engine_connection",
+        "_is_system",
     )
 
     def __init__(
@@ -119,13 +124,21 @@ class Connection(BaseConnection):
         api_endpoint: str,
         additional_parameters: Dict[str, Any] = {},
     ):
-        super().__init__()
+        super().__init__(system_engine_connection)
         self.api_endpoint = api_endpoint
         self.engine_url = engine_url
         self.database = database
         self._cursors: List[Cursor] = []
+        # Multiplex queries over pooled HTTP/2 connections
+        transport = AsyncHTTPTransport(
+            http2=True,
+            limits=Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
         # Override tcp keepalive settings for connection
-        transport = AsyncHTTPTransport()
         transport._pool._network_backend = OverriddenHttpBackend()
         user_drivers = additional_parameters.get("user_drivers", [])
         user_clients = additional_parameters.get("user_clients", [])
@@ -138,7 +151,6 @@ class Connection(BaseConnection):
             transport=transport,
             headers={"User-Agent": get_user_agent_header(user_drivers, user_clients)},
         )
-        self._system_engine_connection = system_engine_connection
 
     def cursor(self, **kwargs: Any) -> Cursor:
         if self.closed:
@@ -260,4 +272,6 @@ async def connect(
             )
         except:  # noqa
             await system_engine_connection.aclose()
+            # Cached system engine url might be outdated
+            _evict_system_engine_url(auth, account_name, api_endpoint)
             raise
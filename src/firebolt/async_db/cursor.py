@@ -16,11 +16,15 @@ from typing import (
     Union,
 )
 
-from httpx import Response, codes
-from tricycle import RWLock
+from httpx import HTTPError, Response, codes
 
-from firebolt.async_db.util import is_db_available, is_engine_running
+from firebolt.async_db.util import (
+    _evict_system_engine_url,
+    is_db_available,
+    is_engine_running,
+)
 from firebolt.client import AsyncClient
+from firebolt.client.auth import Auth
 from firebolt.common._types import (
     ColType,
     Column,
@@ -52,6 +56,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Queries matching this pattern contain credentials and must not be logged
+_CREDENTIALS_RE = re.compile("aws_key_id|credentials", re.IGNORECASE)
+
 
 class Cursor(BaseCursor):
     """
@@ -68,7 +75,7 @@ class Cursor(BaseCursor):
 
     """
 
-    __slots__ = BaseCursor.__slots__ + ("_async_query_lock",)
+    __slots__ = BaseCursor.__slots__ + ("_account_id",)
 
     def __init__(
         self,
@@ -78,16 +85,20 @@ class Cursor(BaseCursor):
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
-        self._async_query_lock = RWLock()
         self._client = client
         self.connection = connection
+        self._account_id: Optional[str] = None
+
+    async def _resolve_account_id(self) -> str:
+        """Get account id from the client once and remember it."""
+        if self._account_id is None:
+            self._account_id = await self._client.account_id
+        return self._account_id
 
     async def _raise_if_error(self, resp: Response) -> None:
         """Raise a proper error if any"""
         if resp.status_code == codes.INTERNAL_SERVER_ERROR:
-            raise OperationalError(
-                f"Error executing query:\n{resp.read().decode('utf-8')}"
-            )
+            raise OperationalError(f"Error executing query:\n{resp.text}")
         if resp.status_code == codes.FORBIDDEN:
             if self.connection.database and not await is_db_available(
                 self.connection, self.connection.database
@@ -95,7 +106,7 @@ class Cursor(BaseCursor):
                 raise FireboltDatabaseError(
                     f"Database {self.connection.database} does not exist"
                 )
-            raise ProgrammingError(resp.read().decode("utf-8"))
+            raise ProgrammingError(resp.text)
         if (
             resp.status_code == codes.SERVICE_UNAVAILABLE
             or resp.status_code == codes.NOT_FOUND
@@ -110,7 +121,7 @@ class Cursor(BaseCursor):
     async def _api_request(
         self,
         query: str = "",
-        parameters: dict[str, Any] = {},
+        parameters: Optional[dict[str, Any]] = None,
         path: str = "",
         use_set_parameters: bool = True,
     ) -> Response:
@@ -129,12 +140,16 @@ class Cursor(BaseCursor):
                 set parameters are sent. Setting this to False will allow
                 self._set_parameters to be ignored.
         """
-        if use_set_parameters:
-            parameters = {**(self._set_parameters or {}), **(parameters or {})}
+        # Callers build a new parameters dict for each request, so it's extended
+        # in place. A merged copy is only needed if set parameters are present
+        if parameters is None:
+            parameters = {}
+        if use_set_parameters and self._set_parameters:
+            parameters = {**self._set_parameters, **parameters}
         if self.connection.database:
             parameters["database"] = self.connection.database
         if self.connection._is_system:
-            parameters["account_id"] = await self._client.account_id
+            parameters["account_id"] = await self._resolve_account_id()
         return await self._client.request(
             url=f"/{path}" if path else "",
             method="POST",
@@ -172,70 +187,126 @@ class Cursor(BaseCursor):
             [raw_query] if skip_parsing else split_format_sql(raw_query, parameters)
         )
         try:
-            for query in queries:
-
-                start_time = time.time()
-                # Our CREATE EXTERNAL TABLE queries currently require credentials,
-                # so we will skip logging those queries.
-                # https://docs.firebolt.io/sql-reference/commands/create-external-table.html
-                if isinstance(query, SetParameter) or not re.search(
-                    "aws_key_id|credentials", query, flags=re.IGNORECASE
-                ):
-                    logger.debug(f"Running query: {query}")
-
-                # Define type for mypy
-                row_set: Tuple[
-                    int,
-                    Optional[List[Column]],
-                    Optional[Statistics],
-                    Optional[List[List[RawColType]]],
-                ] = (-1, None, None, None)
-                if isinstance(query, SetParameter):
-                    await self._validate_set_parameter(query)
-                elif async_execution:
-                    self._validate_server_side_async_settings(
-                        parameters,
-                        queries,
-                        skip_parsing,
-                        async_execution,
-                    )
-                    response = await self._api_request(
-                        query,
-                        {
-                            "async_execution": 1,
-                            "advanced_mode": 1,
-                            "output_format": JSON_OUTPUT_FORMAT,
-                        },
-                    )
-                    await self._raise_if_error(response)
-                    if response.headers.get("content-length", "") == "0":
-                        raise OperationalError("No response to asynchronous query.")
-                    resp = response.json()
-                    if "query_id" not in resp or resp["query_id"] == "":
-                        raise OperationalError(
-                            "Invalid response to asynchronous query: missing query_id."
-                        )
-                    self._query_id = resp["query_id"]
-                else:
-                    resp = await self._api_request(
-                        query, {"output_format": JSON_OUTPUT_FORMAT}
-                    )
-                    await self._raise_if_error(resp)
-                    row_set = self._row_set_from_response(resp)
-
-                self._append_row_set(row_set)
-
-                logger.info(
-                    f"Query fetched {self.rowcount} rows in"
-                    f" {time.time() - start_time} seconds."
+            if (
+                not async_execution
+                and len(queries) == 1
+                and not isinstance(queries[0], SetParameter)
+            ):
+                # Fast path for the most common case of a single plain query
+                await self._do_execute_single(queries[0])
+            else:
+                await self._do_execute_multi(
+                    queries, parameters, skip_parsing, async_execution
                 )
-
             self._state = CursorState.DONE
 
-        except Exception:
+        except Exception as e:
             self._state = CursorState.ERROR
+            if isinstance(e, HTTPError) and self.connection._is_system:
+                # Cached system engine url might be outdated
+                auth = self._client.auth
+                assert isinstance(auth, Auth)  # Type check
+                _evict_system_engine_url(
+                    auth,
+                    self._client.account_name,
+                    self.connection.api_endpoint,
+                )
             raise
 
+    async def _execute_plain_query(
+        self, query: str
+    ) -> Tuple[
+        int,
+        Optional[List[Column]],
+        Optional[Statistics],
+        Optional[List[List[RawColType]]],
+    ]:
+        """Run a plain query and fetch its result set."""
+        resp = await self._api_request(query, {"output_format": JSON_OUTPUT_FORMAT})
+        await self._raise_if_error(resp)
+        return self._row_set_from_response(resp)
+
+    async def _do_execute_single(self, query: str) -> None:
+        """Execute a single plain query, skipping multi-statement handling."""
+        log_timing = logger.isEnabledFor(logging.INFO)
+        start_ns = time.perf_counter_ns() if log_timing else 0
+        # See _do_execute_multi for why queries with credentials are not logged
+        if logger.isEnabledFor(logging.DEBUG) and not _CREDENTIALS_RE.search(query):
+            logger.debug("Running query: %s", query)
+
+        self._append_row_set(await self._execute_plain_query(query))
+
+        if log_timing:
+            logger.info(
+                "Query fetched %s rows in %s seconds.",
+                self.rowcount,
+                (time.perf_counter_ns() - start_ns) / 1e9,
+            )
+
+    async def _do_execute_multi(
+        self,
+        queries: List[Union[SetParameter, str]],
+        parameters: Sequence[Sequence[ParameterType]],
+        skip_parsing: bool = False,
+        async_execution: Optional[bool] = False,
+    ) -> None:
+        log_timing = logger.isEnabledFor(logging.INFO)
+        for query in queries:
+
+            start_ns = time.perf_counter_ns() if log_timing else 0
+            # Our CREATE EXTERNAL TABLE queries currently require credentials,
+            # so we will skip logging those queries.
+            # https://docs.firebolt.io/sql-reference/commands/create-external-table.html
+            if logger.isEnabledFor(logging.DEBUG) and (
+                isinstance(query, SetParameter) or not _CREDENTIALS_RE.search(query)
+            ):
+                logger.debug("Running query: %s", query)
+
+            # Define type for mypy
+            row_set: Tuple[
+                int,
+                Optional[List[Column]],
+                Optional[Statistics],
+                Optional[List[List[RawColType]]],
+            ] = (-1, None, None, None)
+            if isinstance(query, SetParameter):
+                await self._validate_set_parameter(query)
+            elif async_execution:
+                self._validate_server_side_async_settings(
+                    parameters,
+                    queries,
+                    skip_parsing,
+                    async_execution,
+                )
+                response = await self._api_request(
+                    query,
+                    {
+                        "async_execution": 1,
+                        "advanced_mode": 1,
+                        "output_format": JSON_OUTPUT_FORMAT,
+                    },
+                )
+                await self._raise_if_error(response)
+                if response.headers.get("content-length", "") == "0":
+                    raise OperationalError("No response to asynchronous query.")
+                resp = response.json()
+                if "query_id" not in resp or resp["query_id"] == "":
+                    raise OperationalError(
+                        "Invalid response to asynchronous query: missing query_id."
+                    )
+                self._query_id = resp["query_id"]
+            else:
+                row_set = await self._execute_plain_query(query)
+
+            self._append_row_set(row_set)
+
+            if log_timing:
+                logger.info(
+                    "Query fetched %s rows in %s seconds.",
+                    self.rowcount,
+                    (time.perf_counter_ns() - start_ns) / 1e9,
+                )
+
     @check_not_closed
     async def execute(
         self,
@@ -287,6 +358,11 @@ class Cursor(BaseCursor):
         Supports providing multiple substitution parameter sets, executing them
         as multiple statements sequentially.
 
+        Note:
+            Each parameter set is sent to the server as a separate request. For
+            bulk inserts, a single multi-row `INSERT ... VALUES` statement needs
+            only one round trip.
+
         Supported features:
             Parameterized queries: Placeholder characters ('?') are substituted
                 with values provided in `parameters`. Values are formatted to
@@ -384,29 +460,25 @@ class Cursor(BaseCursor):
 
     @wraps(BaseCursor.fetchone)
     async def fetchone(self) -> Optional[List[ColType]]:
-        async with self._async_query_lock.read_locked():
-            """Fetch the next row of a query result set."""
-            return super().fetchone()
+        """Fetch the next row of a query result set."""
+        return super().fetchone()
 
     @wraps(BaseCursor.fetchmany)
     async def fetchmany(self, size: Optional[int] = None) -> List[List[ColType]]:
-        async with self._async_query_lock.read_locked():
-            """
-            Fetch the next set of rows of a query result;
-            size is cursor.arraysize by default.
-            """
-            return super().fetchmany(size)
+        """
+        Fetch the next set of rows of a query result;
+        size is cursor.arraysize by default.
+        """
+        return super().fetchmany(size)
 
     @wraps(BaseCursor.fetchall)
     async def fetchall(self) -> List[List[ColType]]:
-        async with self._async_query_lock.read_locked():
-            """Fetch all remaining rows of a query result."""
-            return super().fetchall()
+        """Fetch all remaining rows of a query result."""
+        return super().fetchall()
 
     @wraps(BaseCursor.nextset)
     async def nextset(self) -> None:
-        async with self._async_query_lock.read_locked():
-            return super().nextset()
+        return super().nextset()
 
     @check_not_closed
     def __enter__(self) -> Cursor:
@@ -1,24 +1,53 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Tuple
+import asyncio
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, Hashable, Tuple
 
-from httpx import URL, Timeout, codes
+from httpx import Timeout, codes
 
 from firebolt.client import AsyncClient
-from firebolt.client.auth import Auth
-from firebolt.common.settings import DEFAULT_TIMEOUT_SECONDS
+from firebolt.client.auth import Auth, ClientCredentials
+from firebolt.common.settings import (
+    DEFAULT_TIMEOUT_SECONDS,
+    SYSTEM_ENGINE_URL_CACHE_TTL_SECONDS,
+)
 from firebolt.utils.exception import (
     AccountNotFoundError,
     FireboltEngineError,
     InterfaceError,
 )
 from firebolt.utils.urls import DYNAMIC_QUERY, GATEWAY_HOST_BY_ACCOUNT_NAME
+from firebolt.utils.util import get_engine_name_from_url
 
 if TYPE_CHECKING:
     from firebolt.async_db.connection import Connection
 
 ENGINE_STATUS_RUNNING = "Running"
 
+# System engine URL of an account rarely changes, so it's reused for
+# SYSTEM_ENGINE_URL_CACHE_TTL_SECONDS per credentials, account and API endpoint.
+# New credentials always request it, which also validates them
+_system_engine_url_cache: Dict[Tuple[Hashable, str, str], Tuple[str, float]] = {}
+
+
+def install_fast_loop() -> bool:
+    """
+    Use uvloop event loop for asyncio, if it's installed.
+
+    uvloop reduces per-request event loop overhead, which dominates
+    short queries. It's installed with `firebolt-sdk[uvloop]` extra.
+
+    Returns:
+        bool: True if uvloop event loop policy was set, False otherwise
+    """
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 async def is_db_available(connection: Connection, database_name: str) -> bool:
     """
@@ -54,7 +83,7 @@ async def is_engine_running(connection: Connection, engine_url: str) -> bool:
         # System engine is always running
         return True
 
-    engine_name = URL(engine_url).host.split(".")[0].replace("-", "_")
+    engine_name = get_engine_name_from_url(engine_url)
     assert connection._system_engine_connection is not None  # Type check
     _, status, _ = await _get_engine_url_status_db(
         connection._system_engine_connection, engine_name
@@ -62,11 +91,35 @@ async def is_engine_running(connection: Connection, engine_url: str) -> bool:
     return status == ENGINE_STATUS_RUNNING
 
 
+def _system_engine_url_cache_key(
+    auth: Auth, account_name: str, api_endpoint: str
+) -> Tuple[Hashable, str, str]:
+    # Auth objects with the same credentials share a cached system engine url
+    credentials: Hashable = (
+        (auth.client_id, auth.client_secret)
+        if isinstance(auth, ClientCredentials)
+        else auth
+    )
+    return (credentials, account_name, api_endpoint)
+
+
+def _evict_system_engine_url(auth: Auth, account_name: str, api_endpoint: str) -> None:
+    """Forget cached system engine URL, so it's requested again on next connect."""
+    _system_engine_url_cache.pop(
+        _system_engine_url_cache_key(auth, account_name, api_endpoint), None
+    )
+
+
 async def _get_system_engine_url(
     auth: Auth,
     account_name: str,
     api_endpoint: str,
 ) -> str:
+    cache_key = _system_engine_url_cache_key(auth, account_name, api_endpoint)
+    now = monotonic()
+    cached = _system_engine_url_cache.get(cache_key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
     async with AsyncClient(
         auth=auth,
         base_url=api_endpoint,
@@ -83,7 +136,17 @@ async def _get_system_engine_url(
                 f"Unable to retrieve system engine endpoint {url}: "
                 f"{response.status_code} {response.content}"
             )
-        return response.json()["engineUrl"] + DYNAMIC_QUERY
+        system_engine_url = response.json()["engineUrl"] + DYNAMIC_QUERY
+        # Drop expired entries to keep the cache from growing. Other threads
+        # might drop the same entries concurrently, so missing keys are ignored
+        for key, (_, expires) in list(_system_engine_url_cache.items()):
+            if expires <= now:
+                _system_engine_url_cache.pop(key, None)
+        _system_engine_url_cache[cache_key] = (
+            system_engine_url,
+            now + SYSTEM_ENGINE_URL_CACHE_TTL_SECONDS,
+        )
+        return system_engine_url
 
 
 async def _get_engine_url_status_db(
@@ -5,16 +5,11 @@ from collections import namedtuple
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import List, Optional, Sequence, Union
+from functools import lru_cache, partial
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 from sqlparse import parse as parse_sql  # type: ignore
-from sqlparse.sql import (  # type: ignore
-    Comment,
-    Comparison,
-    Statement,
-    Token,
-    TokenList,
-)
+from sqlparse.sql import Comment, Comparison, Statement  # type: ignore
 from sqlparse.tokens import Comparison as ComparisonType  # type: ignore
 from sqlparse.tokens import Newline  # type: ignore
 from sqlparse.tokens import Whitespace  # type: ignore
@@ -277,6 +272,16 @@ def parse_value(
     raise DataError(f"Unsupported data type returned: {ctype.__name__}")
 
 
+def get_value_parser(
+    ctype: Union[type, ARRAY, DECIMAL]
+) -> Callable[[RawColType], ColType]:
+    """Return a function parsing non-null raw values into ctype Python values."""
+    if ctype in (int, str, float):
+        assert isinstance(ctype, type)
+        return ctype
+    return partial(parse_value, ctype=ctype)
+
+
 escape_chars = {
     "\0": "\\0",
     "\\": "\\\\",
@@ -309,39 +314,50 @@ def format_value(value: ParameterType) -> str:
     raise DataError(f"unsupported parameter type {type(value)}")
 
 
-def format_statement(statement: Statement, parameters: Sequence[ParameterType]) -> str:
+def _format_fragments(
+    fragments: Sequence[str], parameters: Sequence[ParameterType]
+) -> str:
     """
-    Substitute placeholders in a `sqlparse` statement with provided values.
+    Join query text `fragments`, substituting provided values between them.
     """
-    idx = 0
+    placeholders = len(fragments) - 1
+    if placeholders > len(parameters):
+        raise DataError(
+            "not enough parameters provided for substitution: given "
+            f"{len(parameters)}, found one more"
+        )
+    if placeholders < len(parameters):
+        raise DataError(
+            f"too many parameters provided for substitution: given {len(parameters)}, "
+            f"used only {placeholders}"
+        )
 
-    def process_token(token: Token) -> Token:
-        nonlocal idx
-        if token.ttype == TokenType.Name.Placeholder:
-            # Replace placeholder with formatted parameter
-            if idx >= len(parameters):
-                raise DataError(
-                    "not enough parameters provided for substitution: given "
-                    f"{len(parameters)}, found one more"
-                )
-            formatted = format_value(parameters[idx])
-            idx += 1
-            return Token(TokenType.Text, formatted)
-        if isinstance(token, TokenList):
-            # Process all children tokens
+    parts = [fragments[0]]
+    for value, fragment in zip(parameters, fragments[1:]):
+        parts.append(format_value(value))
+        parts.append(fragment)
+    return "".join(parts).strip().rstrip(";")
 
-            return TokenList([process_token(t) for t in token.tokens])
-        return token
 
-    formatted_sql = statement_to_sql(process_token(statement))
+def _statement_fragments(statement: Statement) -> Tuple[str, ...]:
+    """Split `sqlparse` statement text by placeholders."""
+    fragments: List[str] = []
+    current: List[str] = []
+    for token in statement.flatten():
+        if token.ttype == TokenType.Name.Placeholder:
+            fragments.append("".join(current))
+            current = []
+        else:
+            current.append(token.value)
+    fragments.append("".join(current))
+    return tuple(fragments)
 
-    if idx < len(parameters):
-        raise DataError(
-            f"too many parameters provided for substitution: given {len(parameters)}, "
-            f"used only {idx}"
-        )
 
-    return formatted_sql
+def format_statement(statement: Statement, parameters: Sequence[ParameterType]) -> str:
+    """
+    Substitute placeholders in a `sqlparse` statement with provided values.
+    """
+    return _format_fragments(_statement_fragments(statement), parameters)
 
 
 SetParameter = namedtuple("SetParameter", ["name", "value"])
@@ -410,6 +426,27 @@ def statement_to_sql(statement: Statement) -> str:
     return str(statement).strip().rstrip(";")
 
 
+# Longer queries are parsed on every call to keep parse cache memory bounded
+MAX_CACHED_QUERY_LENGTH = 64 * 1024
+
+# Statement parsed as a SET or plain sql string, along with its text
+# split by placeholders. Parse trees are not kept to keep the cache small
+_SplitStatement = namedtuple("_SplitStatement", ["parsed", "fragments"])
+
+
+def _split_sql(query: str) -> Tuple[_SplitStatement, ...]:
+    """Parse `query` into separate statements, split by placeholders."""
+    return tuple(
+        _SplitStatement(
+            statement_to_set(st) or statement_to_sql(st), _statement_fragments(st)
+        )
+        for st in parse_sql(query)
+    )
+
+
+_split_sql_cached = lru_cache(maxsize=256)(_split_sql)
+
+
 def split_format_sql(
     query: str, parameters: Sequence[Sequence[ParameterType]]
 ) -> List[Union[str, SetParameter]]:
@@ -417,7 +454,11 @@ def split_format_sql(
     Multi-statement query formatting will result in `NotSupportedError`.
     Instead, split a query into a separate statement and format with parameters.
     """
-    statements = parse_sql(query)
+    statements = (
+        _split_sql_cached(query)
+        if len(query) <= MAX_CACHED_QUERY_LENGTH
+        else _split_sql(query)
+    )
     if not statements:
         return [query]
 
@@ -426,9 +467,10 @@ def split_format_sql(
             raise NotSupportedError(
                 "Formatting multi-statement queries is not supported."
             )
-        if statement_to_set(statements[0]):
+        if isinstance(statements[0].parsed, SetParameter):
             raise NotSupportedError("Formatting set statements is not supported.")
-        return [format_statement(statements[0], paramset) for paramset in parameters]
+        fragments = statements[0].fragments
+        return [_format_fragments(fragments, paramset) for paramset in parameters]
 
-    # Try parsing each statement as a SET, otherwise return as a plain sql string
-    return [statement_to_set(st) or statement_to_sql(st) for st in statements]
+    # Each statement is already parsed as a SET or a plain sql string
+    return [st.parsed for st in statements]
@@ -1,13 +1,17 @@
-from typing import Any, List
+from typing import Any, List, Optional
 
 from firebolt.common.base_cursor import BaseCursor
 from firebolt.utils.exception import ConnectionClosedError
 
 
 class BaseConnection:
-    def __init__(self) -> None:
+    def __init__(self, system_engine_connection: Optional[Any]) -> None:
         self._cursors: List[Any] = []
         self._is_closed = False
+        self._system_engine_connection = system_engine_connection
+        # `True` if connection is a system engine connection; `False` otherwise.
+        # Stored as an attribute since it's checked on every request
+        self._is_system = system_engine_connection is None
 
     def _remove_cursor(self, cursor: BaseCursor) -> None:
         # This way it's atomic
@@ -16,11 +20,6 @@ class BaseConnection:
         except ValueError:
             pass
 
-    @property
-    def _is_system(self) -> bool:
-        """`True` if connection is a system engine connection; `False` otherwise."""
-        return self._system_engine_connection is None  # type: ignore
-
     @property
     def closed(self) -> bool:
         """`True` if connection is closed; `False` otherwise."""
@@ -15,8 +15,8 @@ from firebolt.common._types import (
     ParameterType,
     RawColType,
     SetParameter,
+    get_value_parser,
     parse_type,
-    parse_value,
 )
 from firebolt.utils.exception import (
     AsyncExecutionUnavailableError,
@@ -99,6 +99,7 @@ class BaseCursor:
         "_client",
         "_state",
         "_descriptions",
+        "_value_parsers",
         "_statistics",
         "_rowcount",
         "_rows",
@@ -116,6 +117,8 @@ class BaseCursor:
         # These fields initialized here for type annotations purpose
         self._rows: Optional[List[List[RawColType]]] = None
         self._descriptions: Optional[List[Column]] = None
+        # Resolved from _descriptions on first fetch of a row set
+        self._value_parsers: Optional[List[Callable[[RawColType], ColType]]] = None
         self._statistics: Optional[Statistics] = None
         self._row_sets: List[
             Tuple[
@@ -209,6 +212,7 @@ class BaseCursor:
             self._statistics,
             self._rows,
         ) = self._row_sets[self._next_set_idx]
+        self._value_parsers = None
         self._idx = 0
         self._next_set_idx += 1
         return True
@@ -222,6 +226,7 @@ class BaseCursor:
         self._state = CursorState.NONE
         self._rows = None
         self._descriptions = None
+        self._value_parsers = None
         self._statistics = None
         self._rowcount = -1
         self._idx = 0
@@ -301,12 +306,22 @@ class BaseCursor:
                 "queries asynchronously."
             )
 
-    def _parse_row(self, row: List[RawColType]) -> List[ColType]:
-        """Parse a single data row based on query column types."""
-        assert len(row) == len(self.description)
-        return [
-            parse_value(col, self.description[i].type_code) for i, col in enumerate(row)
-        ]
+    def _get_value_parsers(self) -> List[Callable[[RawColType], ColType]]:
+        """Get a value parser for each column of the current result set."""
+        if self._value_parsers is None:
+            assert self._descriptions is not None
+            self._value_parsers = [
+                get_value_parser(d.type_code) for d in self._descriptions
+            ]
+        return self._value_parsers
+
+    @staticmethod
+    def _parse_row(
+        row: List[RawColType], parsers: List[Callable[[RawColType], ColType]]
+    ) -> List[ColType]:
+        """Parse a single data row using per-column value parsers."""
+        assert len(row) == len(parsers)
+        return [None if col is None else parse(col) for parse, col in zip(parsers, row)]
 
     def _get_next_range(self, size: int) -> Tuple[int, int]:
         """
@@ -332,7 +347,7 @@ class BaseCursor:
             # We are out of elements
             return None
         assert self._rows is not None
-        return self._parse_row(self._rows[left])
+        return self._parse_row(self._rows[left], self._get_value_parsers())
 
     @check_not_closed
     @check_query_executed
@@ -345,7 +360,8 @@ class BaseCursor:
         left, right = self._get_next_range(size)
         assert self._rows is not None
         rows = self._rows[left:right]
-        return [self._parse_row(row) for row in rows]
+        parsers = self._get_value_parsers()
+        return [self._parse_row(row, parsers) for row in rows]
 
     @check_not_closed
     @check_query_executed
@@ -354,7 +370,8 @@ class BaseCursor:
         left, right = self._get_next_range(self.rowcount)
         assert self._rows is not None
         rows = self._rows[left:right]
-        return [self._parse_row(row) for row in rows]
+        parsers = self._get_value_parsers()
+        return [self._parse_row(row, parsers) for row in rows]
 
     @check_not_closed
     def setinputsizes(self, sizes: List[int]) -> None:
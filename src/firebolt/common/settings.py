@@ -11,6 +11,12 @@ KEEPALIVE_FLAG: int = 1
 
 KEEPIDLE_RATE: int = 60  # seconds
 DEFAULT_TIMEOUT_SECONDS: int = 60
+# HTTP connection pool limits of a connection client
+MAX_CONNECTIONS: int = 100
+MAX_KEEPALIVE_CONNECTIONS: int = 20
+KEEPALIVE_EXPIRY_SECONDS: int = 30
+# How long a system engine URL is reused before it's requested again
+SYSTEM_ENGINE_URL_CACHE_TTL_SECONDS: int = 60 * 60
 
 CLIENT_ID_ENV = "FIREBOLT_CLIENT_ID"
 CLIENT_SECRET_ENV = "FIREBOLT_CLIENT_SECRET"
@@ -8,7 +8,7 @@ from warnings import warn
 
 from httpcore.backends.base import NetworkStream
 from httpcore.backends.sync import SyncBackend
-from httpx import HTTPTransport, Timeout
+from httpx import HTTPTransport, Limits, Timeout
 from readerwriterlock.rwlock import RWLockWrite
 
 from firebolt.client import DEFAULT_API_URL, Client
@@ -16,11 +16,18 @@ from firebolt.client.auth import Auth
 from firebolt.common.base_connection import BaseConnection
 from firebolt.common.settings import (
     DEFAULT_TIMEOUT_SECONDS,
+    KEEPALIVE_EXPIRY_SECONDS,
     KEEPALIVE_FLAG,
     KEEPIDLE_RATE,
+    MAX_CONNECTIONS,
+    MAX_KEEPALIVE_CONNECTIONS,
 )
 from firebolt.db.cursor import Cursor
-from firebolt.db.util import _get_engine_url_status_db, _get_system_engine_url
+from firebolt.db.util import (
+    _evict_system_engine_url,
+    _get_engine_url_status_db,
+    _get_system_engine_url,
+)
 from firebolt.utils.exception import (
     ConfigurationError,
     ConnectionClosedError,
@@ -101,6 +108,7 @@ class Connection(BaseConnection):
         "_is_closed",
         "_closing_lock",
         "_system_engine_connection",
+        "_is_system",
     )
 
     def __init__(
@@ -113,13 +121,21 @@ class Connection(BaseConnection):
         api_endpoint: str = DEFAULT_API_URL,
         additional_parameters: Dict[str, Any] = {},
     ):
-        super().__init__()
+        super().__init__(system_engine_connection)
         self.api_endpoint = api_endpoint
         self.engine_url = engine_url
         self.database = database
         self._cursors: List[Cursor] = []
+        # Multiplex queries over pooled HTTP/2 connections
+        transport = HTTPTransport(
+            http2=True,
+            limits=Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
         # Override tcp keepalive settings for connection
-        transport = HTTPTransport()
         transport._pool._network_backend = OverriddenHttpBackend()
         user_drivers = additional_parameters.get("user_drivers", [])
         user_clients = additional_parameters.get("user_clients", [])
@@ -132,7 +148,6 @@ class Connection(BaseConnection):
             transport=transport,
             headers={"User-Agent": get_user_agent_header(user_drivers, user_clients)},
         )
-        self._system_engine_connection = system_engine_connection
         # Holding this lock for write means that connection is closing itself.
         # cursor() should hold this lock for read to read/write state
         self._closing_lock = RWLockWrite()
@@ -267,4 +282,6 @@ def connect(
             )
         except:  # noqa
             system_engine_connection.close()
+            # Cached system engine url might be outdated
+            _evict_system_engine_url(auth, account_name, api_endpoint)
             raise
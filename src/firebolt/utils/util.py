@@ -1,32 +1,70 @@
-from functools import lru_cache
-from typing import TYPE_CHECKING, Callable, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    Optional,
+    Type,
+    TypeVar,
+    overload,
+)
 
 from httpx import URL
 
 T = TypeVar("T")
 
 
-def cached_property(func: Callable[..., T]) -> T:
-    """cached_property implementation for 3.7 backward compatibility.
+class cached_property(Generic[T]):
+    """Property that is computed once per instance and then cached.
+
+    The value is stored in instance ``__dict__`` on first access, so later reads
+    are plain attribute lookups. Unlike ``functools.cached_property`` on
+    Python < 3.12, no lock shared between instances is held while computing it.
+    Concurrent first accesses might compute the value more than once.
 
     Args:
         func (Callable): Property getter
-
-    Returns:
-        T: Property of type, returned by getter
     """
-    return property(lru_cache()(func))  # type: ignore
+
+    def __init__(self, func: Callable[[Any], T]):
+        self.func = func
+        self.attrname = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attrname = name
+
+    @overload
+    def __get__(
+        self, instance: None, owner: Optional[type] = None
+    ) -> "cached_property[T]":
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> T:
+        ...
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.attrname] = value
+        return value
 
 
 def prune_dict(d: dict) -> dict:
     """Prune items from dictionaries where value is None.
 
+    If there is nothing to prune, the provided dict is returned as is.
+
     Args:
         d (dict): Dict to prune
 
     Returns:
         dict: Pruned dict
     """
+    if all(v is not None for v in d.values()):
+        return d
     return {k: v for k, v in d.items() if v is not None}
 
 
@@ -69,6 +107,23 @@ def fix_url_schema(url: str) -> str:
     return url if url.startswith("http") else f"https://{url}"
 
 
+def get_engine_name_from_url(engine_url: str) -> str:
+    """Get engine name from its URL.
+
+    Engine name is the first label of the URL host, with dashes
+    replaced by underscores.
+
+    Args:
+        engine_url (str): Engine URL, with or without schema
+
+    Returns:
+        str: Engine name
+    """
+    _, separator, rest = engine_url.partition("://")
+    host = rest if separator else engine_url
+    return host.partition("/")[0].partition(":")[0].partition(".")[0].replace("-", "_")
+
+
 def get_auth_endpoint(api_endpoint: URL) -> URL:
     """Create auth endpoint from api endpoint.
 
@@ -1,7 +1,9 @@
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List
+from functools import lru_cache
+from typing import List, Type
 
+from anyio import sleep
 from pytest import mark, raises
 
 from firebolt.async_db import (
@@ -15,10 +17,31 @@ from firebolt.async_db.cursor import QueryStatus
 from firebolt.common._types import ColType, Column
 from tests.integration.dbapi.utils import assert_deep_eq
 
-VALS_TO_INSERT_2 = ",".join(
-    [f"({i}, {i-3}, '{val}')" for (i, val) in enumerate(range(4, 1000))]
-)
-LONG_INSERT = f"INSERT INTO test_tbl VALUES {VALS_TO_INSERT_2}"
+STATUS_POLL_MIN_DELAY = 0.05  # seconds
+STATUS_POLL_MAX_DELAY = 2.0  # seconds
+
+FETCH_METHODS = ("fetchone", "fetchmany", "fetchall")
+
+TWO_COL_DESCRIPTION = [
+    Column("i", int, None, None, None, None, None),
+    Column("s", str, None, None, None, None, None),
+]
+
+
+async def assert_all_fetches_raise(c: Cursor, exc: Type[Exception] = DataError) -> None:
+    """Every fetch method of a cursor raises exc."""
+    for fetch in FETCH_METHODS:
+        with raises(exc):
+            await getattr(c, fetch)()
+
+
+@lru_cache(maxsize=1)
+def long_insert() -> str:
+    """Build a long insert query only when a test needs it."""
+    values = ",".join(
+        f"({i}, {i-3}, '{val}')" for (i, val) in enumerate(range(4, 1000))
+    )
+    return f"INSERT INTO test_tbl VALUES {values}"
 
 
 async def status_loop(
@@ -35,8 +58,12 @@ async def status_loop(
     test_server_side_async_execution_get_status().
     """
     status = await cursor.get_status(query_id)
+    delay = STATUS_POLL_MIN_DELAY
     # get_status() will return NOT_READY until it succeeds or fails.
     while status == start_status or status == QueryStatus.NOT_READY:
+        # Back off exponentially to avoid flooding the server with requests
+        await sleep(delay)
+        delay = min(delay * 2, STATUS_POLL_MAX_DELAY)
         # This only checks to see if a correct response is returned
         status = await cursor.get_status(query_id)
     assert (
@@ -71,16 +98,18 @@ async def test_select(
     """Select handles all data types properly."""
     with connection.cursor() as c:
         assert (
-            await c.execute(f"SET advanced_mode=1") == -1
-        ), "Invalid set statment row count"
-        # For timestamptz test
-        assert (
-            await c.execute(f"SET time_zone={timezone_name}") == -1
-        ), "Invalid set statment row count"
-        # For boolean test
-        assert (
-            await c.execute(f"SET bool_output_format=postgres") == -1
+            await c.execute(
+                "SET advanced_mode=1;"
+                # For timestamptz test
+                f"SET time_zone={timezone_name};"
+                # For boolean test
+                "SET bool_output_format=postgres"
+            )
+            == -1
         ), "Invalid set statment row count"
+        for _ in range(2):
+            assert await c.nextset(), "Missing set statement result"
+            assert c.rowcount == -1, "Invalid set statment row count"
 
         assert await c.execute(all_types_query) == 1, "Invalid row count returned"
         assert c.rowcount == 1, "Invalid rowcount value"
@@ -91,20 +120,14 @@ async def test_select(
         assert len(data[0]) == len(c.description), "Invalid description length"
         assert len(await c.fetchall()) == 0, "Redundant data returned by fetchall"
 
-        # Different fetch types
+        # Different fetch types, fetchall is covered above
         await c.execute(all_types_query)
+        assert len(await c.fetchmany(0)) == 0, "Invalid data size returned by fetchmany"
         assert (
             await c.fetchone() == all_types_query_response[0]
         ), "Invalid fetchone data"
         assert await c.fetchone() is None, "Redundant data returned by fetchone"
-
-        await c.execute(all_types_query)
-        assert len(await c.fetchmany(0)) == 0, "Invalid data size returned by fetchmany"
-        data = await c.fetchmany()
-        assert len(data) == 1, "Invalid data size returned by fetchmany"
-        assert_deep_eq(
-            data, all_types_query_response, "Invalid data returned by fetchmany"
-        )
+        assert len(await c.fetchmany()) == 0, "Redundant data returned by fetchmany"
 
 
 @mark.skip("Don't have a good way to test this anymore. FIR-16038")
@@ -135,10 +158,12 @@ async def test_drop_create(connection: Connection) -> None:
     """Create table query is handled properly"""
     with connection.cursor() as c:
         # Cleanup
-        await c.execute("DROP JOIN INDEX IF EXISTS test_db_join_idx")
-        await c.execute("DROP AGGREGATING INDEX IF EXISTS test_db_agg_idx")
-        await c.execute("DROP TABLE IF EXISTS test_drop_create_async")
-        await c.execute("DROP TABLE IF EXISTS test_drop_create_async_dim")
+        await c.execute(
+            "DROP JOIN INDEX IF EXISTS test_db_join_idx;"
+            "DROP AGGREGATING INDEX IF EXISTS test_db_agg_idx;"
+            "DROP TABLE IF EXISTS test_drop_create_async;"
+            "DROP TABLE IF EXISTS test_drop_create_async_dim"
+        )
 
         # Fact table
         await test_query(
@@ -190,14 +215,7 @@ async def test_insert(connection: Connection) -> None:
         assert await c.execute(query) == -1, "Invalid row count returned"
         assert c.rowcount == -1, "Invalid rowcount value"
         assert c.description is None, "Invalid description"
-        with raises(DataError):
-            await c.fetchone()
-
-        with raises(DataError):
-            await c.fetchmany()
-
-        with raises(DataError):
-            await c.fetchall()
+        await assert_all_fetches_raise(c)
 
     with connection.cursor() as c:
         await c.execute("DROP TABLE IF EXISTS test_insert_async_tb")
@@ -243,14 +261,7 @@ async def test_parameterized_query(connection: Connection) -> None:
         assert await c.execute(query, params) == -1, "Invalid row count returned"
         assert c.rowcount == -1, "Invalid rowcount value"
         assert c.description is None, "Invalid description"
-        with raises(DataError):
-            await c.fetchone()
-
-        with raises(DataError):
-            await c.fetchmany()
-
-        with raises(DataError):
-            await c.fetchall()
+        await assert_all_fetches_raise(c)
 
     with connection.cursor() as c:
         await c.execute("DROP TABLE IF EXISTS test_tb_async_parameterized")
@@ -315,10 +326,7 @@ async def test_multi_statement_query(connection: Connection) -> None:
         assert c.rowcount == 2, "Invalid select row count"
         assert_deep_eq(
             c.description,
-            [
-                Column("i", int, None, None, None, None, None),
-                Column("s", str, None, None, None, None, None),
-            ],
+            TWO_COL_DESCRIPTION,
             "Invalid select query description",
         )
 
@@ -333,10 +341,7 @@ async def test_multi_statement_query(connection: Connection) -> None:
         assert c.rowcount == 1, "Invalid select row count"
         assert_deep_eq(
             c.description,
-            [
-                Column("i", int, None, None, None, None, None),
-                Column("s", str, None, None, None, None, None),
-            ],
+            TWO_COL_DESCRIPTION,
             "Invalid select query description",
         )
 
@@ -375,7 +380,7 @@ async def test_server_side_async_execution_cancel(
 ) -> None:
     """Test cancel."""
     c = create_server_side_test_table_setup_teardown_async
-    await c.execute(LONG_INSERT, async_execution=True)
+    await c.execute(long_insert(), async_execution=True)
     # Cancel, then check that status is cancelled.
     await c.cancel(query_id)
     await status_loop(
@@ -403,7 +408,7 @@ async def test_server_side_async_execution_get_status(
     to be able to check for specific status states.
     """
     c = create_server_side_test_table_setup_teardown_async
-    query_id = await c.execute(LONG_INSERT, async_execution=True)
+    query_id = await c.execute(long_insert(), async_execution=True)
     await c.get_status(query_id)
     # Commented out assert because I was getting warnig errors about it being
     # always true even when this should be skipping.
@@ -4,7 +4,8 @@ from firebolt.client.auth.base import Auth
 from firebolt.db import Connection, connect
 
 
-@fixture
+# Tests open their own cursors, so a connection is shared within a module
+@fixture(scope="module")
 def connection(
     engine_name: str,
     database_name: str,
@@ -22,6 +23,23 @@ def connection(
         yield connection
 
 
+@fixture(scope="module")
+def common_fact_table(connection: Connection, worker_id: str) -> str:
+    """Fact table with common column types, created once per module.
+
+    Tests using it should truncate it before inserting data.
+    """
+    table = f"test_common_fact_tb_{worker_id}"
+    with connection.cursor() as c:
+        c.execute(
+            f"CREATE FACT TABLE IF NOT EXISTS {table}(id int, sn string null,"
+            "f float, d date, dt datetime, b bool, a array(int)) primary index id"
+        )
+    yield table
+    with connection.cursor() as c:
+        c.execute(f"DROP TABLE IF EXISTS {table}")
+
+
 @fixture
 def connection_no_db(
     engine_name: str,
@@ -1,7 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 from threading import Thread
-from typing import Any, List
+from time import sleep
+from typing import List, Type
 
 from pytest import mark, raises
 
@@ -18,16 +21,37 @@ from firebolt.db import (
 )
 from tests.integration.dbapi.utils import assert_deep_eq
 
-VALS_TO_INSERT = ",".join([f"({i},'{val}')" for (i, val) in enumerate(range(1, 360))])
-LONG_INSERT = f"INSERT INTO test_tbl VALUES {VALS_TO_INSERT}"
+STATUS_POLL_MIN_DELAY = 0.05  # seconds
+STATUS_POLL_MAX_DELAY = 2.0  # seconds
 
+FETCH_METHODS = ("fetchone", "fetchmany", "fetchall")
 
-def assert_deep_eq(got: Any, expected: Any, msg: str) -> bool:
-    if type(got) == list and type(expected) == list:
-        all([assert_deep_eq(f, s, msg) for f, s in zip(got, expected)])
-    assert (
-        type(got) == type(expected) and got == expected
-    ), f"{msg}: {got}(got) != {expected}(expected)"
+TWO_COL_DESCRIPTION = [
+    Column("i", int, None, None, None, None, None),
+    Column("s", str, None, None, None, None, None),
+]
+
+
+def assert_all_fetches_raise(c: Cursor, exc: Type[Exception] = DataError) -> None:
+    """Every fetch method of a cursor raises exc."""
+    for fetch in FETCH_METHODS:
+        with raises(exc):
+            getattr(c, fetch)()
+
+
+@lru_cache(maxsize=1)
+def long_insert() -> str:
+    """Build a long insert query only when a test needs it."""
+    values = ",".join(f"({i},'{val}')" for (i, val) in enumerate(range(1, 360)))
+    return f"INSERT INTO test_tbl VALUES {values}"
+
+
+def run_threads(threads: List[Thread]) -> None:
+    """Start all threads before joining any, so they run concurrently."""
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
 
 
 def status_loop(
@@ -44,8 +68,12 @@ def status_loop(
     test_server_side_async_execution_get_status().
     """
     status = cursor.get_status(query_id)
+    delay = STATUS_POLL_MIN_DELAY
     # get_status() will return NOT_READY until it succeeds or fails.
     while status == start_status or status == QueryStatus.NOT_READY:
+        # Back off exponentially to avoid flooding the server with requests
+        sleep(delay)
+        delay = min(delay * 2, STATUS_POLL_MAX_DELAY)
         # This only checks to see if a correct response is returned
         status = cursor.get_status(query_id)
     assert (
@@ -79,15 +107,19 @@ def test_select(
 ) -> None:
     """Select handles all data types properly."""
     with connection.cursor() as c:
-        assert c.execute(f"SET advanced_mode=1") == -1, "Invalid set statment row count"
-        # For timestamptz test
-        assert (
-            c.execute(f"SET time_zone={timezone_name}") == -1
-        ), "Invalid set statment row count"
-        # For boolean test
         assert (
-            c.execute(f"SET bool_output_format=postgres") == -1
+            c.execute(
+                "SET advanced_mode=1;"
+                # For timestamptz test
+                f"SET time_zone={timezone_name};"
+                # For boolean test
+                "SET bool_output_format=postgres"
+            )
+            == -1
         ), "Invalid set statment row count"
+        for _ in range(2):
+            assert c.nextset(), "Missing set statement result"
+            assert c.rowcount == -1, "Invalid set statment row count"
 
         assert c.execute(all_types_query) == 1, "Invalid row count returned"
         assert c.rowcount == 1, "Invalid rowcount value"
@@ -98,18 +130,12 @@ def test_select(
         assert len(data[0]) == len(c.description), "Invalid description length"
         assert len(c.fetchall()) == 0, "Redundant data returned by fetchall"
 
-        # Different fetch types
+        # Different fetch types, fetchall is covered above
         c.execute(all_types_query)
+        assert len(c.fetchmany(0)) == 0, "Invalid data size returned by fetchmany"
         assert c.fetchone() == all_types_query_response[0], "Invalid fetchone data"
         assert c.fetchone() is None, "Redundant data returned by fetchone"
-
-        c.execute(all_types_query)
-        assert len(c.fetchmany(0)) == 0, "Invalid data size returned by fetchmany"
-        data = c.fetchmany()
-        assert len(data) == 1, "Invalid data size returned by fetchmany"
-        assert_deep_eq(
-            data, all_types_query_response, "Invalid data returned by fetchmany"
-        )
+        assert len(c.fetchmany()) == 0, "Redundant data returned by fetchmany"
 
 
 @mark.skip("Don't have a good way to test this anymore. FIR-16038")
@@ -130,7 +156,7 @@ def test_long_query(
         assert len(data) == 360, "Invalid data size returned by fetchall"
 
 
-def test_drop_create(connection: Connection) -> None:
+def test_drop_create(connection: Connection, worker_id: str) -> None:
     """Create and drop table/index queries are handled properly."""
 
     def test_query(c: Cursor, query: str, empty_response=True) -> None:
@@ -139,87 +165,82 @@ def test_drop_create(connection: Connection) -> None:
         assert c.rowcount == (-1 if empty_response else 0)
 
     """Create table query is handled properly"""
+    table = f"test_drop_create_tb_{worker_id}"
+    dim_table = f"test_drop_create_tb_dim_{worker_id}"
+    join_index = f"test_drop_create_db_join_idx_{worker_id}"
+    agg_index = f"test_drop_create_db_agg_idx_{worker_id}"
     with connection.cursor() as c:
         # Cleanup
-        c.execute("DROP JOIN INDEX IF EXISTS test_drop_create_db_join_idx")
-        c.execute("DROP AGGREGATING INDEX IF EXISTS test_drop_create_db_agg_idx")
-        c.execute("DROP TABLE IF EXISTS test_drop_create_tb")
-        c.execute("DROP TABLE IF EXISTS test_drop_create_tb_dim")
+        c.execute(
+            f"DROP JOIN INDEX IF EXISTS {join_index};"
+            f"DROP AGGREGATING INDEX IF EXISTS {agg_index};"
+            f"DROP TABLE IF EXISTS {table};"
+            f"DROP TABLE IF EXISTS {dim_table}"
+        )
 
         # Fact table
         test_query(
             c,
-            "CREATE FACT TABLE test_drop_create_tb(id int, sn string null, f float,"
+            f"CREATE FACT TABLE {table}(id int, sn string null, f float,"
             "d date, dt datetime, b bool, a array(int)) primary index id",
         )
 
         # Dimension table
         test_query(
             c,
-            "CREATE DIMENSION TABLE test_drop_create_tb_dim(id int, sn string null"
+            f"CREATE DIMENSION TABLE {dim_table}(id int, sn string null"
             ", f float, d date, dt datetime, b bool, a array(int))",
         )
 
         # Create join index
         test_query(
             c,
-            "CREATE JOIN INDEX test_drop_create_db_join_idx ON "
-            "test_drop_create_tb_dim(id, sn, f)",
+            f"CREATE JOIN INDEX {join_index} ON {dim_table}(id, sn, f)",
         )
 
         # Create aggregating index
         test_query(
             c,
-            "CREATE AGGREGATING INDEX test_drop_create_db_agg_idx ON "
-            "test_drop_create_tb(id, sum(f), count(dt))",
+            f"CREATE AGGREGATING INDEX {agg_index} ON "
+            f"{table}(id, sum(f), count(dt))",
             empty_response=False,
         )
 
         # Drop join index
-        test_query(c, "DROP JOIN INDEX test_drop_create_db_join_idx")
+        test_query(c, f"DROP JOIN INDEX {join_index}")
 
         # Drop aggregating index
-        test_query(c, "DROP AGGREGATING INDEX test_drop_create_db_agg_idx")
+        test_query(c, f"DROP AGGREGATING INDEX {agg_index}")
 
         # Test drop once again
-        test_query(c, "DROP TABLE test_drop_create_tb")
-        test_query(c, "DROP TABLE IF EXISTS test_drop_create_tb")
+        test_query(c, f"DROP TABLE {table}")
+        test_query(c, f"DROP TABLE IF EXISTS {table}")
 
-        test_query(c, "DROP TABLE test_drop_create_tb_dim")
-        test_query(c, "DROP TABLE IF EXISTS test_drop_create_tb_dim")
+        test_query(c, f"DROP TABLE {dim_table}")
+        test_query(c, f"DROP TABLE IF EXISTS {dim_table}")
 
 
-def test_insert(connection: Connection) -> None:
+def test_insert(connection: Connection, common_fact_table: str) -> None:
     """Insert and delete queries are handled properly."""
 
     def test_empty_query(c: Cursor, query: str) -> None:
         assert c.execute(query) == -1, "Invalid row count returned"
         assert c.rowcount == -1, "Invalid rowcount value"
         assert c.description is None, "Invalid description"
-        with raises(DataError):
-            c.fetchone()
-
-        with raises(DataError):
-            c.fetchmany()
-
-        with raises(DataError):
-            c.fetchall()
+        assert_all_fetches_raise(c)
 
+    table = common_fact_table
     with connection.cursor() as c:
-        c.execute("DROP TABLE IF EXISTS test_insert_tb")
-        c.execute(
-            "CREATE FACT TABLE test_insert_tb(id int, sn string null, f float,"
-            "d date, dt datetime, b bool, a array(int)) primary index id"
-        )
+        c.execute(f"TRUNCATE TABLE {table}")
 
         test_empty_query(
             c,
-            "INSERT INTO test_insert_tb VALUES (1, 'sn', 1.1, '2021-01-01',"
+            f"INSERT INTO {table} VALUES (1, 'sn', 1.1, '2021-01-01',"
             "'2021-01-01 01:01:01', true, [1, 2, 3])",
         )
 
         assert (
-            c.execute("SELECT * FROM test_insert_tb ORDER BY test_insert_tb.id") == 1
+            c.execute(f"SELECT * FROM {table} ORDER BY {table}.id") == 1
         ), "Invalid data length in table after insert"
 
         assert_deep_eq(
@@ -239,28 +260,22 @@ def test_insert(connection: Connection) -> None:
         )
 
 
-def test_parameterized_query(connection: Connection) -> None:
+def test_parameterized_query(connection: Connection, worker_id: str) -> None:
     """Query parameters are handled properly."""
 
     def test_empty_query(c: Cursor, query: str, params: tuple) -> None:
         assert c.execute(query, params) == -1, "Invalid row count returned"
         assert c.rowcount == -1, "Invalid rowcount value"
         assert c.description is None, "Invalid description"
-        with raises(DataError):
-            c.fetchone()
-
-        with raises(DataError):
-            c.fetchmany()
-
-        with raises(DataError):
-            c.fetchall()
+        assert_all_fetches_raise(c)
 
+    table = f"test_tb_parameterized_{worker_id}"
     with connection.cursor() as c:
-        c.execute("DROP TABLE IF EXISTS test_tb_parameterized")
         c.execute(
-            "CREATE FACT TABLE test_tb_parameterized(i int, f float, s string, sn"
+            f"CREATE FACT TABLE IF NOT EXISTS {table}(i int, f float, s string, sn"
             " string null, d date, dt datetime, b bool, a array(int), "
-            "dec decimal(38, 3), ss string) primary index i",
+            "dec decimal(38, 3), ss string) primary index i;"
+            f"TRUNCATE TABLE {table}",
         )
 
         params = [
@@ -277,8 +292,7 @@ def test_parameterized_query(connection: Connection) -> None:
 
         test_empty_query(
             c,
-            "INSERT INTO test_tb_parameterized VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?,"
-            " '\\?')",
+            f"INSERT INTO {table} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, '\\?')",
             params,
         )
 
@@ -286,7 +300,7 @@ def test_parameterized_query(connection: Connection) -> None:
         params[2] = "text0"
 
         assert (
-            c.execute("SELECT * FROM test_tb_parameterized") == 1
+            c.execute(f"SELECT * FROM {table}") == 1
         ), "Invalid data length in table after parameterized insert"
 
         assert_deep_eq(
@@ -296,19 +310,20 @@ def test_parameterized_query(connection: Connection) -> None:
         )
 
 
-def test_multi_statement_query(connection: Connection) -> None:
+def test_multi_statement_query(connection: Connection, worker_id: str) -> None:
     """Query parameters are handled properly"""
 
+    table = f"test_tb_multi_statement_{worker_id}"
     with connection.cursor() as c:
-        c.execute("DROP TABLE IF EXISTS test_tb_multi_statement")
         c.execute(
-            "CREATE FACT TABLE test_tb_multi_statement(i int, s string) primary index i"
+            f"CREATE FACT TABLE IF NOT EXISTS {table}(i int, s string) primary index i;"
+            f"TRUNCATE TABLE {table}"
         )
 
         c.execute(
-            "INSERT INTO test_tb_multi_statement values (1, 'a'), (2, 'b');"
-            "SELECT * FROM test_tb_multi_statement;"
-            "SELECT * FROM test_tb_multi_statement WHERE i <= 1"
+            f"INSERT INTO {table} values (1, 'a'), (2, 'b');"
+            f"SELECT * FROM {table};"
+            f"SELECT * FROM {table} WHERE i <= 1"
         )
         assert c.description is None, "Invalid description"
 
@@ -317,10 +332,7 @@ def test_multi_statement_query(connection: Connection) -> None:
         assert c.rowcount == 2, "Invalid select row count"
         assert_deep_eq(
             c.description,
-            [
-                Column("i", int, None, None, None, None, None),
-                Column("s", str, None, None, None, None, None),
-            ],
+            TWO_COL_DESCRIPTION,
             "Invalid select query description",
         )
 
@@ -335,10 +347,7 @@ def test_multi_statement_query(connection: Connection) -> None:
         assert c.rowcount == 1, "Invalid select row count"
         assert_deep_eq(
             c.description,
-            [
-                Column("i", int, None, None, None, None, None),
-                Column("s", str, None, None, None, None, None),
-            ],
+            TWO_COL_DESCRIPTION,
             "Invalid select query description",
         )
 
@@ -362,6 +371,9 @@ def test_set_invalid_parameter(connection: Connection):
 
 # Run test multiple times since the issue is flaky
 @mark.parametrize("_", range(5))
+# connection fixture authenticates with the shared auth object first,
+# so the threads below reuse its token
+@mark.usefixtures("connection")
 def test_anyio_backend_import_issue(
     engine_name: str,
     database_name: str,
@@ -372,34 +384,28 @@ def test_anyio_backend_import_issue(
 ) -> None:
     threads_cnt = 3
     requests_cnt = 8
-    # collect threads exceptions in an array because they're ignored otherwise
-    exceptions = []
 
-    def run_query(idx: int):
+    def run_query(idx: int) -> None:
         nonlocal auth, database_name, engine_name, account_name, api_endpoint
-        try:
-            with connect(
-                auth=auth,
-                database=database_name,
-                account_name=account_name,
-                engine_name=engine_name,
-                api_endpoint=api_endpoint,
-            ) as c:
-                cursor = c.cursor()
-                cursor.execute(f"select {idx}")
-        except BaseException as e:
-            exceptions.append(e)
-
-    def run_queries_parallel() -> None:
-        nonlocal requests_cnt
-        threads = [Thread(target=run_query, args=(i,)) for i in range(requests_cnt)]
-        [t.start() for t in threads]
-        [t.join() for t in threads]
-
-    threads = [Thread(target=run_queries_parallel) for _ in range(threads_cnt)]
-
-    [t.start() for t in threads]
-    [t.join() for t in threads]
+        with connect(
+            auth=auth,
+            database=database_name,
+            account_name=account_name,
+            engine_name=engine_name,
+            api_endpoint=api_endpoint,
+        ) as c:
+            cursor = c.cursor()
+            cursor.execute(f"select {idx}")
+
+    # A new executor for each run, so every run starts in fresh threads
+    with ThreadPoolExecutor(max_workers=threads_cnt * requests_cnt) as executor:
+        futures = [
+            executor.submit(run_query, i)
+            for _ in range(threads_cnt)
+            for i in range(requests_cnt)
+        ]
+    # collect threads exceptions from futures because they're ignored otherwise
+    exceptions = [e for e in (f.exception() for f in futures) if e is not None]
     assert len(exceptions) == 0, exceptions
 
 
@@ -443,7 +449,7 @@ async def test_server_side_async_execution_get_status(
 ) -> None:
     """Test get_status()."""
     c = create_server_side_test_table_setup_teardown
-    query_id = c.execute(LONG_INSERT, async_execution=True)
+    query_id = c.execute(long_insert(), async_execution=True)
     status = c.get_status(query_id)
     # Commented out assert because I was getting warnig errors about it being
     # always true even when this should be skipping.
@@ -484,13 +490,7 @@ def test_multi_thread_connection_sharing(
         except BaseException as e:
             exceptions.append(e)
 
-    thread_1 = Thread(target=run_query)
-    thread_2 = Thread(target=run_query)
-
-    thread_1.start()
-    thread_1.join()
-    thread_2.start()
-    thread_2.join()
+    run_threads([Thread(target=run_query) for _ in range(2)])
 
     connection.close()
     assert not exceptions
@@ -498,18 +498,20 @@ def test_multi_thread_connection_sharing(
 
 def test_bytea_roundtrip(
     connection: Connection,
+    worker_id: str,
 ) -> None:
     """Inserted and than selected bytea value doesn't get corrupted."""
+    table = f"test_bytea_roundtrip_{worker_id}"
     with connection.cursor() as c:
-        c.execute("DROP TABLE IF EXISTS test_bytea_roundtrip")
         c.execute(
-            "CREATE FACT TABLE test_bytea_roundtrip(id int, b bytea) primary index id"
+            f"CREATE FACT TABLE IF NOT EXISTS {table}(id int, b bytea) primary index id;"
+            f"TRUNCATE TABLE {table}"
         )
 
         data = "bytea_123\n\tヽ༼ຈل͜ຈ༽ﾉ"
 
-        c.execute("INSERT INTO test_bytea_roundtrip VALUES (1, ?)", (Binary(data),))
-        c.execute("SELECT b FROM test_bytea_roundtrip")
+        c.execute(f"INSERT INTO {table} VALUES (1, ?)", (Binary(data),))
+        c.execute(f"SELECT b FROM {table}")
 
         bytes_data = (c.fetchone())[0]
 
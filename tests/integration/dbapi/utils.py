@@ -2,8 +2,11 @@ from typing import Any
 
 
 def assert_deep_eq(got: Any, expected: Any, msg: str) -> bool:
-    if type(got) == list and type(expected) == list:
-        all([assert_deep_eq(f, s, msg) for f, s in zip(got, expected)])
     assert (
         type(got) == type(expected) and got == expected
     ), f"{msg}: {got}(got) != {expected}(expected)"
+    if type(got) == list:
+        # Values are equal, nested values still have to match by type
+        for f, s in zip(got, expected):
+            assert_deep_eq(f, s, msg)
+    return True
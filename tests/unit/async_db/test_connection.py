@@ -1,6 +1,8 @@
-from typing import Callable, List
+from time import monotonic
+from typing import Callable, List, Optional
 from unittest.mock import patch
 
+from httpx import HTTPStatusError, Request, Response, codes
 from pyfakefs.fake_filesystem_unittest import Patcher
 from pytest import mark, raises
 from pytest_httpx import HTTPXMock
@@ -8,8 +10,12 @@ from pytest_httpx import HTTPXMock
 from firebolt.async_db.connection import Connection, connect
 from firebolt.client.auth import Auth, ClientCredentials
 from firebolt.common._types import ColType
-from firebolt.common.settings import Settings
+from firebolt.common.settings import (
+    SYSTEM_ENGINE_URL_CACHE_TTL_SECONDS,
+    Settings,
+)
 from firebolt.utils.exception import (
+    AuthenticationError,
     ConfigurationError,
     ConnectionClosedError,
     EngineNotRunningError,
@@ -167,7 +173,7 @@ async def test_connect_database(
         await connection.cursor().execute("select*")
 
     httpx_mock.reset(True)
-    httpx_mock.add_callback(get_system_engine_callback, url=get_system_engine_url)
+    # System engine url is cached after the first connect
     httpx_mock.add_callback(query_callback, url=system_engine_query_url)
     httpx_mock.add_callback(account_id_callback, url=account_id_url)
 
@@ -180,6 +186,83 @@ async def test_connect_database(
         assert await connection.cursor().execute("select*") == len(python_query_data)
 
 
+async def test_connect_system_engine_url_cache(
+    db_name: str,
+    engine_name: str,
+    auth_url: str,
+    server: str,
+    auth: Auth,
+    client_id: str,
+    client_secret: str,
+    account_name: str,
+    httpx_mock: HTTPXMock,
+    query_callback: str,
+    check_credentials_callback: Callable,
+    system_engine_query_url: str,
+    system_engine_no_db_query_url: str,
+    get_system_engine_url: str,
+    get_system_engine_callback: Callable,
+    account_id_url: str,
+    account_id_callback: Callable,
+):
+    """System engine url is reused only for same credentials until it's stale"""
+
+    def check_credentials(request: Request = None, **kwargs) -> Response:
+        if f"client_secret={client_secret}" not in request.read().decode("utf-8"):
+            return Response(status_code=codes.UNAUTHORIZED, json={})
+        return check_credentials_callback(request)
+
+    httpx_mock.add_callback(check_credentials, url=auth_url)
+    httpx_mock.add_callback(get_system_engine_callback, url=get_system_engine_url)
+    httpx_mock.add_callback(query_callback, url=system_engine_no_db_query_url)
+    httpx_mock.add_callback(account_id_callback, url=account_id_url)
+    httpx_mock.add_response(
+        status_code=codes.SERVICE_UNAVAILABLE, url=system_engine_query_url
+    )
+
+    async def connect_and_query(auth: Auth, database: Optional[str] = None) -> None:
+        async with await connect(
+            database=database,
+            auth=auth,
+            account_name=account_name,
+            api_endpoint=server,
+        ) as connection:
+            await connection.cursor().execute("select*")
+
+    def system_engine_url_requests() -> int:
+        return len(httpx_mock.get_requests(url=get_system_engine_url))
+
+    await connect_and_query(auth)
+    await connect_and_query(ClientCredentials(client_id, client_secret))
+    assert system_engine_url_requests() == 1, "System engine url is not cached"
+
+    with raises(AuthenticationError):
+        await connect_and_query(ClientCredentials(client_id, "invalid", False))
+
+    with patch(
+        "firebolt.async_db.util.monotonic",
+        return_value=monotonic() + SYSTEM_ENGINE_URL_CACHE_TTL_SECONDS,
+    ):
+        await connect_and_query(auth)
+    assert system_engine_url_requests() == 2, "Expired system engine url is used"
+
+    with raises(HTTPStatusError):
+        await connect(
+            database=db_name,
+            engine_name=engine_name,
+            auth=auth,
+            account_name=account_name,
+            api_endpoint=server,
+        )
+    await connect_and_query(auth)
+    assert system_engine_url_requests() == 3, "Failed system engine url is used"
+
+    with raises(HTTPStatusError):
+        await connect_and_query(auth, db_name)
+    await connect_and_query(auth)
+    assert system_engine_url_requests() == 4, "Failed system engine url is used"
+
+
 async def test_connection_commit(connection: Connection):
     # nothing happens
     connection.commit()
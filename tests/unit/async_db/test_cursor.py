@@ -1,12 +1,15 @@
+import logging
 from typing import Any, Callable, Dict, List
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 from httpx import HTTPStatusError, StreamError, codes
-from pytest import raises
+from pytest import LogCaptureFixture, raises
 from pytest_httpx import HTTPXMock
 
-from firebolt.async_db import Cursor
-from firebolt.common._types import Column
+from firebolt.async_db import Cursor, connect
+from firebolt.client import AsyncClient
+from firebolt.client.auth import Auth
+from firebolt.common._types import Column, get_value_parser
 from firebolt.common.base_cursor import ColType, CursorState, QueryStatus
 from firebolt.common.settings import Settings
 from firebolt.utils.exception import (
@@ -529,6 +532,52 @@ async def test_cursor_fetchall(
         await cursor.fetchall()
 
 
+async def test_cursor_fetchall_no_fetchone(
+    mock_query: Callable,
+    cursor: Cursor,
+    python_query_data: List[List[ColType]],
+):
+    """cursor fetchall and fetchmany read rows without calling fetchone."""
+    mock_query()
+    await cursor.execute("sql")
+
+    with patch.object(
+        Cursor, "fetchone", side_effect=AssertionError("fetchone called")
+    ):
+        assert (
+            await cursor.fetchmany(1) == python_query_data[:1]
+        ), "Invalid fetchmany data"
+        assert await cursor.fetchall() == python_query_data[1:], "Invalid fetchall data"
+
+
+async def test_cursor_value_parsers_resolved_once(
+    mock_query: Callable,
+    cursor: Cursor,
+    python_query_description: List[Column],
+):
+    """cursor resolves column value parsers once per result set."""
+    mock_query()
+    await cursor.execute("sql")
+
+    with patch(
+        "firebolt.common.base_cursor.get_value_parser",
+        wraps=get_value_parser,
+    ) as get_parser_mock:
+        await cursor.fetchone()
+        await cursor.fetchmany(2)
+        await cursor.fetchall()
+        assert get_parser_mock.call_count == len(
+            python_query_description
+        ), "Value parsers resolved more than once"
+
+        mock_query()
+        await cursor.execute("sql")
+        await cursor.fetchone()
+        assert get_parser_mock.call_count == 2 * len(
+            python_query_description
+        ), "Value parsers not resolved for a new result set"
+
+
 async def test_cursor_multi_statement(
     mock_query: Callable,
     mock_insert_query: Callable,
@@ -692,6 +741,54 @@ async def test_cursor_skip_parse(
         split_format_sql_mock.assert_not_called()
 
 
+async def test_cursor_credentials_not_logged(
+    mock_query: Callable,
+    cursor: Cursor,
+    caplog: LogCaptureFixture,
+):
+    """Queries containing credentials are never logged."""
+    mock_query()
+    with caplog.at_level(logging.DEBUG, logger="firebolt.async_db.cursor"):
+        await cursor.execute("select * from t")
+        await cursor.execute("create external table t credentials = (aws_key_id='k')")
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert "Running query: select * from t" in messages
+    assert not any("aws_key_id" in m for m in messages)
+
+
+async def test_cursor_account_id_resolved_once(
+    httpx_mock: HTTPXMock,
+    auth: Auth,
+    account_name: str,
+    server: str,
+    account_id: str,
+    mock_system_connection_flow: Callable,
+    query_callback: Callable,
+    system_engine_no_db_query_url: str,
+):
+    """System engine cursor reads account id from the client once."""
+    mock_system_connection_flow()
+    httpx_mock.add_callback(query_callback, url=system_engine_no_db_query_url)
+
+    async def get_account_id() -> str:
+        return account_id
+
+    with patch.object(
+        AsyncClient,
+        "account_id",
+        new_callable=PropertyMock,
+        side_effect=get_account_id,
+    ) as account_id_mock:
+        async with await connect(
+            auth=auth, account_name=account_name, api_endpoint=server
+        ) as connection:
+            cursor = connection.cursor()
+            await cursor.execute("select*")
+            await cursor.execute("select*")
+            account_id_mock.assert_called_once()
+
+
 async def test_cursor_server_side_async_execute(
     httpx_mock: HTTPXMock,
     server_side_async_id_callback: Callable,
@@ -1,6 +1,7 @@
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from typing import List, Optional
+from unittest.mock import patch
 
 from pytest import mark, raises
 from sqlparse import parse
@@ -13,6 +14,7 @@ from firebolt.async_db import (
     NotSupportedError,
 )
 from firebolt.common._types import (
+    MAX_CACHED_QUERY_LENGTH,
     SetParameter,
     format_statement,
     format_value,
@@ -170,6 +172,26 @@ def test_split_format_error() -> None:
         split_format_sql("set a = ?", ((1,),))
 
 
+def test_split_format_sql_cache() -> None:
+    """Parsed queries are cached unless they are too long."""
+    query = "select * from t_split_cache where id == ?"
+    with patch("firebolt.common._types.parse_sql", wraps=parse) as parse_mock:
+        assert split_format_sql(query, ((1,),)) == [
+            "select * from t_split_cache where id == 1"
+        ]
+        assert split_format_sql(query, ((2,), (3,))) == [
+            "select * from t_split_cache where id == 2",
+            "select * from t_split_cache where id == 3",
+        ]
+        parse_mock.assert_called_once()
+
+    long_query = f"select '{'a' * MAX_CACHED_QUERY_LENGTH}', ?"
+    with patch("firebolt.common._types.parse_sql", wraps=parse) as parse_mock:
+        split_format_sql(long_query, ((1,),))
+        split_format_sql(long_query, ((1,),))
+        assert parse_mock.call_count == 2
+
+
 @mark.parametrize(
     "statement,result",
     [
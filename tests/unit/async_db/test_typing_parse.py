@@ -11,7 +11,7 @@ from firebolt.async_db import (
     TimeFromTicks,
     TimestampFromTicks,
 )
-from firebolt.common._types import parse_type, parse_value
+from firebolt.common._types import get_value_parser, parse_type, parse_value
 from firebolt.utils.exception import DataError, NotSupportedError
 
 
@@ -267,3 +267,24 @@ def test_parse_value_bytes() -> None:
     for val in (1, True, Exception()):
         with raises(DataError):
             parse_value(val, bytes)
+
+
+def test_get_value_parser() -> None:
+    """get_value_parser returns parsers matching parse_value results."""
+    for value, ctype in (
+        ("1", int),
+        ("1.1", float),
+        (1, str),
+        ("2021-12-31", date),
+        ("2021-12-31 23:59:59", datetime),
+        (True, bool),
+        ("\\x616263", bytes),
+        ("123.456", DECIMAL(38, 3)),
+        (["1", None], ARRAY(int)),
+    ):
+        assert get_value_parser(ctype)(value) == parse_value(
+            value, ctype
+        ), f"Invalid parser for {ctype}"
+
+    with raises(DataError):
+        get_value_parser(date)(1)
@@ -0,0 +1,20 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+from firebolt.async_db.util import install_fast_loop
+
+
+def test_install_fast_loop() -> None:
+    """install_fast_loop sets uvloop policy only if uvloop is installed."""
+    with patch.dict(sys.modules, {"uvloop": None}), patch(
+        "firebolt.async_db.util.asyncio.set_event_loop_policy"
+    ) as set_policy:
+        assert not install_fast_loop(), "Loop installed without uvloop"
+        set_policy.assert_not_called()
+
+    uvloop = MagicMock()
+    with patch.dict(sys.modules, {"uvloop": uvloop}), patch(
+        "firebolt.async_db.util.asyncio.set_event_loop_policy"
+    ) as set_policy:
+        assert install_fast_loop(), "Loop not installed with uvloop available"
+        set_policy.assert_called_once_with(uvloop.EventLoopPolicy.return_value)
@@ -6,13 +6,17 @@ from pyfakefs.fake_filesystem_unittest import Patcher
 from pytest import mark
 from pytest_httpx import HTTPXMock
 
+from firebolt.client import Client
 from firebolt.client.auth import Auth
 from firebolt.utils.token_storage import TokenSecureStorage
 from tests.unit.util import execute_generator_requests
 
 
 def test_auth_refresh_on_expiration(
-    httpx_mock: HTTPXMock, access_token: str, access_token_2: str
+    httpx_mock: HTTPXMock,
+    access_token: str,
+    access_token_2: str,
+    generator_client: Client,
 ) -> None:
     """Auth refreshes the token on expiration."""
     url = "https://host"
@@ -30,18 +34,25 @@ def test_auth_refresh_on_expiration(
     auth = Auth(use_token_cache=False)
     # Get token for the first time
     auth.get_new_token_generator = MethodType(set_token(access_token), auth)
-    execute_generator_requests(auth.auth_flow(Request("GET", url)))
+    execute_generator_requests(
+        auth.auth_flow(Request("GET", url)), client=generator_client
+    )
     assert auth.token == access_token, "invalid access token"
     assert auth.expired
 
     # Refresh token
     auth.get_new_token_generator = MethodType(set_token(access_token_2), auth)
-    execute_generator_requests(auth.auth_flow(Request("GET", url)))
+    execute_generator_requests(
+        auth.auth_flow(Request("GET", url)), client=generator_client
+    )
     assert auth.token == access_token_2, "Expired access token was not updated."
 
 
 def test_auth_uses_same_token_if_valid(
-    httpx_mock: HTTPXMock, access_token: str, access_token_2: str
+    httpx_mock: HTTPXMock,
+    access_token: str,
+    access_token_2: str,
+    generator_client: Client,
 ) -> None:
     """Auth reuses the token until it's expired."""
     url = "https://host"
@@ -59,13 +70,17 @@ def test_auth_uses_same_token_if_valid(
     auth = Auth(use_token_cache=False)
     # Get token for the first time
     auth.get_new_token_generator = MethodType(set_token(access_token), auth)
-    execute_generator_requests(auth.auth_flow(Request("GET", url)))
+    execute_generator_requests(
+        auth.auth_flow(Request("GET", url)), client=generator_client
+    )
     assert auth.token == access_token, "invalid access token"
     assert not auth.expired
 
     # Refresh token
     auth.get_new_token_generator = MethodType(set_token(access_token_2), auth)
-    execute_generator_requests(auth.auth_flow(Request("GET", url)))
+    execute_generator_requests(
+        auth.auth_flow(Request("GET", url)), client=generator_client
+    )
     assert auth.token == access_token, "Should not update token until it expires."
 
 
@@ -89,6 +104,7 @@ def test_auth_token_storage(
     client_id: str,
     client_secret: str,
     access_token: str,
+    generator_client: Client,
 ) -> None:
     # Mock auth flow
     def set_token(token: str) -> callable:
@@ -109,7 +125,9 @@ def test_auth_token_storage(
         auth = Auth(use_token_cache=True)
         # Get token
         auth.get_new_token_generator = MethodType(set_token(access_token), auth)
-        execute_generator_requests(auth.auth_flow(Request("GET", url)))
+        execute_generator_requests(
+            auth.auth_flow(Request("GET", url)), client=generator_client
+        )
 
         st = TokenSecureStorage(client_id, client_secret)
         assert st.get_cached_token() == access_token, "Invalid token value cached"
@@ -122,7 +140,9 @@ def test_auth_token_storage(
         auth = Auth(use_token_cache=False)
         # Get token
         auth.get_new_token_generator = MethodType(set_token(access_token), auth)
-        execute_generator_requests(auth.auth_flow(Request("GET", url)))
+        execute_generator_requests(
+            auth.auth_flow(Request("GET", url)), client=generator_client
+        )
         st = TokenSecureStorage(client_id, client_secret)
         assert (
             st.get_cached_token() is None
@@ -6,8 +6,15 @@ from httpx import Request, Response
 from pyfakefs.fake_filesystem_unittest import Patcher
 from pytest import fixture
 
+from firebolt.async_db.util import (
+    _system_engine_url_cache as async_system_engine_url_cache,
+)
+from firebolt.client import Client
 from firebolt.client.auth import Auth, ClientCredentials
 from firebolt.common.settings import Settings
+from firebolt.db.util import (
+    _system_engine_url_cache as system_engine_url_cache,
+)
 from firebolt.model.provider import Provider
 from firebolt.model.region import Region, RegionKey
 from firebolt.utils.exception import (
@@ -48,6 +55,12 @@ def global_fake_fs(request) -> None:
             yield
 
 
+@fixture(autouse=True)
+def clear_system_engine_url_cache() -> None:
+    async_system_engine_url_cache.clear()
+    system_engine_url_cache.clear()
+
+
 @fixture
 def client_id() -> str:
     return "client_id"
@@ -321,3 +334,10 @@ def check_credentials_callback(
         )
 
     return check_credentials
+
+
+@fixture(scope="session")
+def generator_client() -> Client:
+    """Client shared by tests sending auth generator requests."""
+    with Client(account_name="account", auth=Auth(), api_endpoint="") as client:
+        yield client
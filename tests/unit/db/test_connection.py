@@ -1,17 +1,23 @@
 import gc
 import warnings
-from typing import Callable, List
+from time import monotonic
+from typing import Callable, List, Optional
 from unittest.mock import patch
 
+from httpx import HTTPStatusError, Request, Response, codes
 from pyfakefs.fake_filesystem_unittest import Patcher
 from pytest import mark, raises, warns
 from pytest_httpx import HTTPXMock
 
 from firebolt.client.auth import Auth, ClientCredentials
 from firebolt.common._types import ColType
-from firebolt.common.settings import Settings
+from firebolt.common.settings import (
+    SYSTEM_ENGINE_URL_CACHE_TTL_SECONDS,
+    Settings,
+)
 from firebolt.db import Connection, connect
 from firebolt.utils.exception import (
+    AuthenticationError,
     ConfigurationError,
     ConnectionClosedError,
     EngineNotRunningError,
@@ -170,7 +176,7 @@ def test_connect_database(
         connection.cursor().execute("select*")
 
     httpx_mock.reset(True)
-    httpx_mock.add_callback(get_system_engine_callback, url=get_system_engine_url)
+    # System engine url is cached after the first connect
     httpx_mock.add_callback(query_callback, url=system_engine_query_url)
     httpx_mock.add_callback(account_id_callback, url=account_id_url)
 
@@ -183,6 +189,83 @@ def test_connect_database(
         assert connection.cursor().execute("select*") == len(python_query_data)
 
 
+def test_connect_system_engine_url_cache(
+    db_name: str,
+    engine_name: str,
+    auth_url: str,
+    server: str,
+    auth: Auth,
+    client_id: str,
+    client_secret: str,
+    account_name: str,
+    httpx_mock: HTTPXMock,
+    query_callback: str,
+    check_credentials_callback: Callable,
+    system_engine_query_url: str,
+    system_engine_no_db_query_url: str,
+    get_system_engine_url: str,
+    get_system_engine_callback: Callable,
+    account_id_url: str,
+    account_id_callback: Callable,
+):
+    """System engine url is reused only for same credentials until it's stale"""
+
+    def check_credentials(request: Request = None, **kwargs) -> Response:
+        if f"client_secret={client_secret}" not in request.read().decode("utf-8"):
+            return Response(status_code=codes.UNAUTHORIZED, json={})
+        return check_credentials_callback(request)
+
+    httpx_mock.add_callback(check_credentials, url=auth_url)
+    httpx_mock.add_callback(get_system_engine_callback, url=get_system_engine_url)
+    httpx_mock.add_callback(query_callback, url=system_engine_no_db_query_url)
+    httpx_mock.add_callback(account_id_callback, url=account_id_url)
+    httpx_mock.add_response(
+        status_code=codes.SERVICE_UNAVAILABLE, url=system_engine_query_url
+    )
+
+    def connect_and_query(auth: Auth, database: Optional[str] = None) -> None:
+        with connect(
+            database=database,
+            auth=auth,
+            account_name=account_name,
+            api_endpoint=server,
+        ) as connection:
+            connection.cursor().execute("select*")
+
+    def system_engine_url_requests() -> int:
+        return len(httpx_mock.get_requests(url=get_system_engine_url))
+
+    connect_and_query(auth)
+    connect_and_query(ClientCredentials(client_id, client_secret))
+    assert system_engine_url_requests() == 1, "System engine url is not cached"
+
+    with raises(AuthenticationError):
+        connect_and_query(ClientCredentials(client_id, "invalid", False))
+
+    with patch(
+        "firebolt.db.util.monotonic",
+        return_value=monotonic() + SYSTEM_ENGINE_URL_CACHE_TTL_SECONDS,
+    ):
+        connect_and_query(auth)
+    assert system_engine_url_requests() == 2, "Expired system engine url is used"
+
+    with raises(HTTPStatusError):
+        connect(
+            database=db_name,
+            engine_name=engine_name,
+            auth=auth,
+            account_name=account_name,
+            api_endpoint=server,
+        )
+    connect_and_query(auth)
+    assert system_engine_url_requests() == 3, "Failed system engine url is used"
+
+    with raises(HTTPStatusError):
+        connect_and_query(auth, db_name)
+    connect_and_query(auth)
+    assert system_engine_url_requests() == 4, "Failed system engine url is used"
+
+
 def test_connection_unclosed_warnings(auth: Auth):
     c = Connection("", "", auth, "", None)
     with warns(UserWarning) as winfo:
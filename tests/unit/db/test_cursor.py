@@ -1,10 +1,12 @@
+import logging
 from typing import Any, Callable, Dict, List
 from unittest.mock import patch
 
 from httpx import HTTPStatusError, StreamError, codes
-from pytest import raises
+from pytest import LogCaptureFixture, raises
 from pytest_httpx import HTTPXMock
 
+from firebolt.common._types import get_value_parser
 from firebolt.common.settings import Settings
 from firebolt.db import Cursor
 from firebolt.db.cursor import ColType, Column, CursorState, QueryStatus
@@ -446,6 +448,50 @@ def test_cursor_fetchall(
         cursor.fetchall()
 
 
+def test_cursor_fetchall_no_fetchone(
+    mock_query: Callable,
+    cursor: Cursor,
+    python_query_data: List[List[ColType]],
+):
+    """cursor fetchall and fetchmany read rows without calling fetchone."""
+    mock_query()
+    cursor.execute("sql")
+
+    with patch.object(
+        Cursor, "fetchone", side_effect=AssertionError("fetchone called")
+    ):
+        assert cursor.fetchmany(1) == python_query_data[:1], "Invalid fetchmany data"
+        assert cursor.fetchall() == python_query_data[1:], "Invalid fetchall data"
+
+
+def test_cursor_value_parsers_resolved_once(
+    mock_query: Callable,
+    cursor: Cursor,
+    python_query_description: List[Column],
+):
+    """cursor resolves column value parsers once per result set."""
+    mock_query()
+    cursor.execute("sql")
+
+    with patch(
+        "firebolt.common.base_cursor.get_value_parser",
+        wraps=get_value_parser,
+    ) as get_parser_mock:
+        cursor.fetchone()
+        cursor.fetchmany(2)
+        cursor.fetchall()
+        assert get_parser_mock.call_count == len(
+            python_query_description
+        ), "Value parsers resolved more than once"
+
+        mock_query()
+        cursor.execute("sql")
+        cursor.fetchone()
+        assert get_parser_mock.call_count == 2 * len(
+            python_query_description
+        ), "Value parsers not resolved for a new result set"
+
+
 def test_cursor_multi_statement(
     mock_query: Callable,
     mock_insert_query: Callable,
@@ -597,6 +643,22 @@ def test_cursor_skip_parse(
         split_format_sql_mock.assert_not_called()
 
 
+def test_cursor_credentials_not_logged(
+    mock_query: Callable,
+    cursor: Cursor,
+    caplog: LogCaptureFixture,
+):
+    """Queries containing credentials are never logged."""
+    mock_query()
+    with caplog.at_level(logging.DEBUG, logger="firebolt.db.cursor"):
+        cursor.execute("select * from t")
+        cursor.execute("create external table t credentials = (aws_key_id='k')")
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert "Running query: select * from t" in messages
+    assert not any("aws_key_id" in m for m in messages)
+
+
 def test_cursor_server_side_async_execute(
     httpx_mock: HTTPXMock,
     server_side_async_id_callback: Callable,
@@ -1,4 +1,4 @@
-from typing import AsyncGenerator, Dict, Generator, List
+from typing import AsyncGenerator, Dict, Generator, List, Optional
 
 from httpx import Request, Response
 
@@ -12,25 +12,29 @@ def list_to_paginated_response(items: List[FireboltBaseModel]) -> Dict:
 
 
 def execute_generator_requests(
-    requests: Generator[Request, Response, None], api_endpoint: str = ""
+    requests: Generator[Request, Response, None],
+    api_endpoint: str = "",
+    client: Optional[Client] = None,
 ) -> None:
-    request = next(requests)
+    """Send generator requests, using a provided client or a new one."""
+    if client is None:
+        with Client(
+            account_name="account", auth=Auth(), api_endpoint=api_endpoint
+        ) as client:
+            execute_generator_requests(requests, client=client)
+        return
 
-    with Client(
-        account_name="account", auth=Auth(), api_endpoint=api_endpoint
-    ) as client:
-        client._auth = None
+    request = next(requests)
+    client._auth = None
+    try:
         while True:
-            response = client.send(request)
-            try:
-                request = requests.send(response)
-            except StopIteration:
-                break
+            request = requests.send(client.send(request))
+    except StopIteration:
+        pass
 
 
 async def async_execute_generator_requests(
-    requests: AsyncGenerator[Request, Response],
-    api_endpoint: str = "",
+    requests: AsyncGenerator[Request, Response], api_endpoint: str = ""
 ) -> None:
     request = await requests.__anext__()
 
@@ -38,9 +42,8 @@ async def async_execute_generator_requests(
         account_name="account", auth=Auth(), api_endpoint=api_endpoint
     ) as client:
         client._auth = None
-        while True:
-            response = await client.send(request)
-            try:
-                request = await requests.asend(response)
-            except StopAsyncIteration:
-                break
+        try:
+            while True:
+                request = await requests.asend(await client.send(request))
+        except StopAsyncIteration:
+            pass
@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from pytest import mark
+
+from firebolt.utils.util import (
+    cached_property,
+    get_engine_name_from_url,
+    prune_dict,
+)
+
+
+@mark.parametrize(
+    "engine_url,expected",
+    [
+        ("https://my-engine.a.eu-west-1.aws.firebolt.io", "my_engine"),
+        ("https://my-engine.a.eu-west-1.aws.firebolt.io/dynamic/query", "my_engine"),
+        ("my-engine.a.eu-west-1.aws.firebolt.io", "my_engine"),
+        ("http://localhost:8123/query", "localhost"),
+    ],
+)
+def test_get_engine_name_from_url(engine_url: str, expected: str) -> None:
+    assert get_engine_name_from_url(engine_url) == expected
+
+
+def test_prune_dict() -> None:
+    assert prune_dict({"a": 1, "b": None, "c": 0}) == {"a": 1, "c": 0}
+    # Nothing to prune, same dict is returned
+    d = {"a": 1, "b": False}
+    assert prune_dict(d) is d
+
+
+def test_cached_property() -> None:
+    """cached_property computes value once per instance."""
+
+    class Counter:
+        calls = 0
+
+        @cached_property
+        def value(self) -> int:
+            Counter.calls += 1
+            return Counter.calls
+
+    first, second = Counter(), Counter()
+    assert (first.value, first.value, second.value) == (1, 1, 2)
+    assert first.__dict__["value"] == 1, "Value is not stored in instance"
+    assert isinstance(Counter.value, cached_property)
+
+
+def test_cached_property_no_shared_lock() -> None:
+    """First accesses on different instances run concurrently."""
+    barrier = Barrier(2, timeout=5)
+
+    class Waiter:
+        @cached_property
+        def value(self) -> int:
+            # Breaks if the other instance's getter can't run at the same time
+            return barrier.wait()
+
+    with ThreadPoolExecutor(2) as executor:
+        results = list(executor.map(lambda w: w.value, [Waiter(), Waiter()]))
+    assert sorted(results) == [0, 1]